@@ -4,6 +4,7 @@ Python script to run all tests with one command
 Supports Windows/Linux/macOS
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
@@ -26,32 +27,33 @@ def print_colored(text: str, color: str = RESET) -> None:
 
 def check_pytest_installed() -> bool:
     """Check if pytest is installed"""
-    try:
-        subprocess.run([sys.executable, "-m", "pytest", "--version"], 
-                      capture_output=True, check=True)
-        return True
-    except subprocess.CalledProcessError:
-        return False
+    return importlib.util.find_spec("pytest") is not None
 
 
 def install_pytest() -> bool:
-    """Install pytest and pytest-cov"""
-    print_colored("Installing pytest and pytest-cov...", YELLOW)
+    """Install pytest and the test runner plugins"""
+    print_colored("Installing pytest and test plugins...", YELLOW)
     try:
         subprocess.run([sys.executable, "-m", "pip", "install", 
-                       "pytest", "pytest-cov"], check=True)
+                       "pytest", "pytest-cov", "pytest-xdist",
+                       "pytest-fastcollect", "pytest-testmon"], check=True)
         return True
     except subprocess.CalledProcessError:
         return False
 
 
-def run_tests(mode: str = "standard") -> int:
+def get_worker_count() -> int:
+    """Number of xdist workers, leaving two cores free for the rest of the system"""
+    return max(1, (os.cpu_count() or 1) - 2)
+
+
+def run_tests(
+    mode: str = "standard", serial: bool = False, legacy_collect: bool = False
+) -> int:
     """Run tests"""
-    # Set environment variables
-    env = os.environ.copy()
     src_path = Path(__file__).parent / "src"
-    env["PYTHONPATH"] = str(src_path) + os.pathsep + env.get("PYTHONPATH", "")
-    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    # Extra environment variables for the pytest subprocess
+    extra_env = {}
     
     # Base command
     cmd = [sys.executable, "-m", "pytest", "src/tests/", "-v", "--tb=short"]
@@ -63,11 +65,19 @@ def run_tests(mode: str = "standard") -> int:
             "--cov=src/claude_monitor",
             "--cov-report=term-missing",
             "--cov-report=html:htmlcov",
+            "--cov-context=test",
         ])
+        if sys.version_info >= (3, 14):
+            # sys.monitoring based tracer has much lower overhead; it can
+            # only measure branch coverage (enabled in pyproject) from 3.14
+            extra_env["COVERAGE_CORE"] = os.environ.get("COVERAGE_CORE", "sysmon")
     elif mode == "quick":
         # Quick test
         print_colored("⚡ Running quick test...", BLUE)
         # Don't add coverage parameters
+        # Runs in-process below; xdist workers would bring back the
+        # interpreter startups that avoids
+        serial = True
     elif mode == "new":
         # Test new features only
         print_colored("🆕 Running new feature tests only...", BLUE)
@@ -75,6 +85,17 @@ def run_tests(mode: str = "standard") -> int:
                "src/tests/test_aggregator.py",
                "src/tests/test_table_views.py", 
                "-v", "--tb=short"]
+    elif mode == "incremental":
+        # Only tests affected by changes since the last run
+        print_colored("🔁 Running tests affected by recent changes...", BLUE)
+        if importlib.util.find_spec("testmon") is not None:
+            # testmon refuses to run alongside branch coverage, and would
+            # stop selecting because of the -m filter in the pyproject addopts
+            cmd.extend(["--testmon", "--testmon-forceselect", "--no-cov"])
+        else:
+            print_colored("pytest-testmon not installed, running all tests", YELLOW)
+        # testmon tracks dependencies per process and does not support xdist
+        serial = True
     else:
         # Standard test
         print_colored("🚀 Running standard test...", BLUE)
@@ -84,13 +105,35 @@ def run_tests(mode: str = "standard") -> int:
             "--cov-report=term",
         ])
     
+    # Spread tests across CPU cores when pytest-xdist is available
+    if not serial and importlib.util.find_spec("xdist") is not None:
+        cmd.extend(["-n", str(get_worker_count()), "--dist=loadfile"])
+    
+    # Fall back to pytest's own collector (for A/B comparisons)
+    if legacy_collect and importlib.util.find_spec("pytest_fastcollect") is not None:
+        cmd.append("--no-fast-collect")
+    
     # Add color support
     if sys.platform != "win32":
         cmd.append("--color=yes")
     
     # Run tests
     try:
-        result = subprocess.run(cmd, env=env)
+        if mode == "quick":
+            # Run in-process to skip interpreter startup; coverage modes
+            # keep the subprocess so coverage.py gets a clean process
+            os.environ["PYTHONDONTWRITEBYTECODE"] = "1"
+            sys.dont_write_bytecode = True
+            sys.path.insert(0, str(src_path))
+            import pytest
+
+            return int(pytest.main(cmd[3:]))
+        result = subprocess.run(cmd, env={
+            **os.environ,
+            "PYTHONPATH": str(src_path) + os.pathsep + os.environ.get("PYTHONPATH", ""),
+            "PYTHONDONTWRITEBYTECODE": "1",
+            **extra_env,
+        })
         return result.returncode
     except Exception as e:
         print_colored(f"Error running tests: {e}", RED)
@@ -106,9 +149,10 @@ def show_menu() -> str:
     print("2. Full coverage test (generate HTML report)")
     print("3. Quick test (no coverage)")
     print("4. Test new features only")
-    print("5. Exit")
+    print("5. Changed tests only (pytest-testmon)")
+    print("6. Exit")
     
-    choice = input("\nPlease enter option (1-5) [default: 1]: ").strip() or "1"
+    choice = input("\nPlease enter option (1-6) [default: 1]: ").strip() or "1"
     return choice
 
 
@@ -123,30 +167,39 @@ def main():
                 print_colored("✅ pytest installed successfully!", GREEN)
             else:
                 print_colored("❌ pytest installation failed, please install manually:", RED)
-                print("   pip install pytest pytest-cov")
+                print("   pip install pytest pytest-cov pytest-xdist pytest-fastcollect pytest-testmon")
                 sys.exit(1)
         else:
             print("Please install pytest before running tests")
             sys.exit(1)
     
     # Parse command line arguments
-    if len(sys.argv) > 1:
-        arg = sys.argv[1]
+    args = sys.argv[1:]
+    serial = "--serial" in args
+    legacy_collect = "--legacy-collect" in args
+    args = [a for a in args if a not in ("--serial", "--legacy-collect")]
+    if args:
+        arg = args[0]
         if arg in ["--help", "-h"]:
             print("Usage: python run_tests.py [options]")
             print("\nOptions:")
             print("  --coverage, -c    Run full coverage test")
             print("  --quick, -q       Run quick test (no coverage)")
             print("  --new, -n         Run new feature tests only")
+            print("  --changed, -i     Run only tests affected by changes (pytest-testmon)")
+            print("  --serial          Run tests in a single process (no pytest-xdist)")
+            print("  --legacy-collect  Use pytest's default collector (no pytest-fastcollect)")
             print("  --help, -h        Show help information")
             print("\nEnter interactive mode when no arguments provided")
             sys.exit(0)
         elif arg in ["--coverage", "-c"]:
-            exit_code = run_tests("coverage")
+            exit_code = run_tests("coverage", serial, legacy_collect)
         elif arg in ["--quick", "-q"]:
-            exit_code = run_tests("quick")
+            exit_code = run_tests("quick", serial, legacy_collect)
         elif arg in ["--new", "-n"]:
-            exit_code = run_tests("new")
+            exit_code = run_tests("new", serial, legacy_collect)
+        elif arg in ["--changed", "-i"]:
+            exit_code = run_tests("incremental", serial, legacy_collect)
         else:
             print_colored(f"❌ Unknown argument: {arg}", RED)
             print("Use --help for help")
@@ -155,14 +208,16 @@ def main():
         # Interactive mode
         choice = show_menu()
         if choice == "1":
-            exit_code = run_tests("standard")
+            exit_code = run_tests("standard", serial, legacy_collect)
         elif choice == "2":
-            exit_code = run_tests("coverage")
+            exit_code = run_tests("coverage", serial, legacy_collect)
         elif choice == "3":
-            exit_code = run_tests("quick")
+            exit_code = run_tests("quick", serial, legacy_collect)
         elif choice == "4":
-            exit_code = run_tests("new")
+            exit_code = run_tests("new", serial, legacy_collect)
         elif choice == "5":
+            exit_code = run_tests("incremental", serial, legacy_collect)
+        elif choice == "6":
             print_colored("👋 Exit", YELLOW)
             sys.exit(0)
         else:
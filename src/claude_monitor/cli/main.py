@@ -2,37 +2,38 @@
 
 import argparse
 import contextlib
+import functools
 import logging
+import os
+import signal
 import sys
+import threading
 import traceback
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, NoReturn, Optional, Union
-
-from rich.console import Console
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from claude_monitor import __version__
-from claude_monitor.cli.bootstrap import (
-    ensure_directories,
-    init_timezone,
-    setup_environment,
-    setup_logging,
-)
-from claude_monitor.core.plans import Plans, PlanType, get_token_limit
-from claude_monitor.core.settings import Settings
-from claude_monitor.data.aggregator import UsageAggregator
-from claude_monitor.data.analysis import analyze_usage
-from claude_monitor.error_handling import report_error
-from claude_monitor.monitoring.orchestrator import MonitoringOrchestrator
-from claude_monitor.terminal.manager import (
-    enter_alternate_screen,
-    handle_cleanup_and_exit,
-    handle_error_and_exit,
-    restore_terminal,
-    setup_terminal,
-)
-from claude_monitor.terminal.themes import get_themed_console, print_themed
-from claude_monitor.ui.display_controller import DisplayController
-from claude_monitor.ui.table_views import TableViewsController
+
+# Everything beyond the stdlib is imported where it is used so that
+# --version and --help do not pay for rich, pydantic and the data layer.
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from claude_monitor.core.models import UsageEntry
+    from claude_monitor.utils.time_utils import TimezoneHandler
+
+logger = logging.getLogger(__name__)
 
 # Type aliases for CLI callbacks
 DataUpdateCallback = Callable[[Dict[str, Any]], None]
@@ -60,7 +61,7 @@ def discover_claude_data_paths(custom_paths: Optional[List[str]] = None) -> List
     discovered_paths: List[Path] = []
 
     for path_str in paths_to_check:
-        path = Path(path_str).expanduser().resolve()
+        path = Path(path_str).expanduser()
         if path.exists() and path.is_dir():
             discovered_paths.append(path)
 
@@ -77,6 +78,14 @@ def main(argv: Optional[List[str]] = None) -> int:
         return 0
 
     try:
+        from claude_monitor.cli.bootstrap import (
+            ensure_directories,
+            init_timezone,
+            setup_environment,
+            setup_logging,
+        )
+        from claude_monitor.core.settings import Settings
+
         settings = Settings.load_with_last_used(argv)
 
         setup_environment()
@@ -99,7 +108,6 @@ def main(argv: Optional[List[str]] = None) -> int:
         print("\n\nMonitoring stopped by user.")
         return 0
     except Exception as e:
-        logger = logging.getLogger(__name__)
         logger.error(f"Monitor failed: {e}", exc_info=True)
         traceback.print_exc()
         return 1
@@ -107,8 +115,20 @@ def main(argv: Optional[List[str]] = None) -> int:
 
 def _run_monitoring(args: argparse.Namespace) -> None:
     """Main monitoring implementation without facade."""
-    view_mode = getattr(args, "view", "realtime")
-    if hasattr(args, "theme") and args.theme:
+    from claude_monitor.error_handling import report_error
+    from claude_monitor.monitoring.orchestrator import MonitoringOrchestrator
+    from claude_monitor.terminal.manager import (
+        enter_alternate_screen,
+        handle_cleanup_and_exit,
+        handle_error_and_exit,
+        restore_terminal,
+        setup_terminal,
+    )
+    from claude_monitor.terminal.themes import get_themed_console, print_themed
+    from claude_monitor.ui.display_controller import DisplayController
+
+    view_mode: str = args.view
+    if args.theme:
         console = get_themed_console(force_theme=args.theme.lower())
     else:
         console = get_themed_console()
@@ -123,7 +143,6 @@ def _run_monitoring(args: argparse.Namespace) -> None:
             return
 
         data_path: Path = data_paths[0]
-        logger = logging.getLogger(__name__)
         logger.info(f"Using data path: {data_path}")
 
         # Handle different view modes
@@ -136,7 +155,7 @@ def _run_monitoring(args: argparse.Namespace) -> None:
         display_controller = DisplayController()
         display_controller.live_manager._console = console
 
-        refresh_per_second: float = getattr(args, "refresh_per_second", 0.75)
+        refresh_per_second: float = args.refresh_per_second
         logger.info(
             f"Display refresh rate: {refresh_per_second} Hz ({1000 / refresh_per_second:.0f}ms)"
         )
@@ -161,9 +180,7 @@ def _run_monitoring(args: argparse.Namespace) -> None:
             live_display.update(loading_display)
 
             orchestrator = MonitoringOrchestrator(
-                update_interval=args.refresh_rate
-                if hasattr(args, "refresh_rate")
-                else 10,
+                update_interval=args.refresh_rate,
                 data_path=str(data_path),
             )
             orchestrator.set_args(args)
@@ -175,15 +192,17 @@ def _run_monitoring(args: argparse.Namespace) -> None:
                     data: Dict[str, Any] = monitoring_data.get("data", {})
                     blocks: List[Dict[str, Any]] = data.get("blocks", [])
 
-                    logger.debug(f"Display data has {len(blocks)} blocks")
-                    if blocks:
-                        active_blocks: List[Dict[str, Any]] = [
-                            b for b in blocks if b.get("isActive")
-                        ]
-                        logger.debug(f"Active blocks: {len(active_blocks)}")
-                        if active_blocks:
-                            total_tokens: int = active_blocks[0].get("totalTokens", 0)
-                            logger.debug(f"Active block tokens: {total_tokens}")
+                    # Skip building debug details unless DEBUG logging is on
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Display data has %d blocks", len(blocks))
+                        active_block: Optional[Dict[str, Any]] = next(
+                            (b for b in blocks if b.get("isActive")), None
+                        )
+                        if active_block:
+                            logger.debug(
+                                "Active block tokens: %s",
+                                active_block.get("totalTokens", 0),
+                            )
 
                     renderable = display_controller.create_data_display(
                         data, args, monitoring_data.get("token_limit", token_limit)
@@ -224,10 +243,7 @@ def _run_monitoring(args: argparse.Namespace) -> None:
                 logger.warning("Timeout waiting for initial data")
 
             # Main loop - live display is already active
-            while True:
-                import time
-
-                time.sleep(1)
+            _wait_for_interrupt()
         finally:
             # Stop monitoring first
             if "orchestrator" in locals():
@@ -254,17 +270,51 @@ def _run_monitoring(args: argparse.Namespace) -> None:
         restore_terminal(old_terminal_settings)
 
 
+def _wait_for_interrupt() -> NoReturn:
+    """Block the calling thread until Ctrl+C is pressed.
+
+    Waits on an event set by a temporary SIGINT handler instead of polling
+    with sleep. On Windows an untimed wait is not interrupted by Ctrl+C, so
+    there it waits in short slices. The previous handler is restored
+    afterwards.
+
+    Raises:
+        KeyboardInterrupt: Once SIGINT has been received
+    """
+    stop_event = threading.Event()
+    previous_handler = None
+    if threading.current_thread() is threading.main_thread():
+        previous_handler = signal.signal(
+            signal.SIGINT, lambda *_: stop_event.set()
+        )
+
+    try:
+        if os.name == "nt":
+            while not stop_event.wait(0.5):
+                pass
+        else:
+            stop_event.wait()
+    finally:
+        if previous_handler is not None:
+            signal.signal(signal.SIGINT, previous_handler)
+
+    raise KeyboardInterrupt
+
+
 def _get_initial_token_limit(
     args: argparse.Namespace, data_path: Union[str, Path]
 ) -> int:
     """Get initial token limit for the plan."""
-    logger = logging.getLogger(__name__)
-    plan: str = getattr(args, "plan", PlanType.PRO.value)
+    from claude_monitor.core.plans import Plans, get_token_limit
+    from claude_monitor.data.analysis import analyze_usage
+    from claude_monitor.terminal.themes import print_themed
+
+    plan: str = args.plan
 
     # For custom plans, check if custom_limit_tokens is provided first
     if plan == "custom":
         # If custom_limit_tokens is explicitly set, use it
-        if hasattr(args, "custom_limit_tokens") and args.custom_limit_tokens:
+        if args.custom_limit_tokens:
             custom_limit = int(args.custom_limit_tokens)
             print_themed(
                 f"Using custom token limit: {custom_limit:,} tokens",
@@ -318,8 +368,6 @@ def handle_application_error(
         component: Component where the error occurred
         exit_code: Exit code to use when terminating
     """
-    logger = logging.getLogger(__name__)
-
     # Log the error with traceback
     logger.error(f"Application error in {component}: {exception}", exc_info=True)
 
@@ -372,8 +420,123 @@ def validate_cli_environment() -> Optional[str]:
         return f"Environment validation failed: {e}"
 
 
+def _parse_timestamps(
+    timestamp_strs: List[str], tz_handler: "TimezoneHandler"
+) -> List[Optional[datetime]]:
+    """Parse a batch of timestamp strings.
+
+    analyze_usage emits timestamps via ``datetime.isoformat()``, which
+    ``datetime.fromisoformat`` parses natively. A trailing 'Z' is rewritten
+    to '+00:00' first since fromisoformat only accepts it on Python 3.11+.
+    Anything it still rejects (or that lacks an offset) goes through the
+    slower ``TimezoneHandler`` parser.
+
+    Args:
+        timestamp_strs: Timestamp strings, possibly empty
+        tz_handler: Handler used for non-ISO or naive timestamps
+
+    Returns:
+        Parsed datetimes, None for empty, non-string or unparseable values
+    """
+    fromisoformat = datetime.fromisoformat
+    parse_timestamp = tz_handler.parse_timestamp
+    parsed: List[Optional[datetime]] = []
+    append = parsed.append
+
+    for timestamp_str in timestamp_strs:
+        if not timestamp_str or not isinstance(timestamp_str, str):
+            append(None)
+            continue
+        try:
+            if timestamp_str[-1] == "Z":
+                timestamp = fromisoformat(timestamp_str[:-1] + "+00:00")
+            else:
+                timestamp = fromisoformat(timestamp_str)
+        except ValueError:
+            timestamp = None
+        if timestamp is None or timestamp.tzinfo is None:
+            timestamp = parse_timestamp(timestamp_str)
+        append(timestamp)
+
+    return parsed
+
+
+def _extract_usage_entries(blocks: List[Dict[str, Any]]) -> List["UsageEntry"]:
+    """Build usage entries from the entry dicts of all non-gap blocks.
+
+    Invalid entries are logged and skipped; negative counts and costs are
+    clamped to zero.
+
+    Args:
+        blocks: Block dictionaries as returned by analyze_usage
+
+    Returns:
+        List of validated UsageEntry objects
+    """
+    from claude_monitor.core.models import UsageEntry
+    from claude_monitor.utils.time_utils import TimezoneHandler
+
+    tz_handler = TimezoneHandler()
+
+    # Flatten once so the conversion below is a single loop; malformed
+    # blocks and entries are skipped here so they cannot abort the batch
+    raw_entries: List[Tuple[int, int, Dict[str, Any]]] = []
+    for block_idx, block in enumerate(blocks):
+        try:
+            # Skip gap blocks
+            if block.get("isGap", False):
+                continue
+
+            for entry_idx, entry_data in enumerate(block.get("entries", [])):
+                if not isinstance(entry_data, dict):
+                    logger.warning(
+                        f"Invalid entry data in block {block_idx}, entry {entry_idx}"
+                    )
+                    continue
+                raw_entries.append((block_idx, entry_idx, entry_data))
+        except Exception as e:
+            logger.error(f"Error processing block {block_idx}: {e}")
+
+    # Parse all timestamps in one batch before building entries
+    timestamps = _parse_timestamps(
+        [entry_data.get("timestamp", "") for _, _, entry_data in raw_entries],
+        tz_handler,
+    )
+
+    entries: List[UsageEntry] = []
+    append = entries.append
+
+    for (block_idx, entry_idx, entry_data), timestamp in zip(raw_entries, timestamps):
+        try:
+            if timestamp is None:
+                logger.warning(
+                    f"Missing or invalid timestamp in block {block_idx}, entry {entry_idx}"
+                )
+                continue
+
+            append(
+                UsageEntry(
+                    timestamp=timestamp,
+                    input_tokens=max(0, int(entry_data.get("inputTokens", 0))),
+                    output_tokens=max(0, int(entry_data.get("outputTokens", 0))),
+                    cache_creation_tokens=max(0, int(entry_data.get("cacheCreationTokens", 0))),
+                    cache_read_tokens=max(0, int(entry_data.get("cacheReadTokens", 0))),
+                    cost_usd=max(0.0, float(entry_data.get("costUSD", 0.0))),
+                    model=str(entry_data.get("model", "")),
+                    message_id=str(entry_data.get("messageId", "")),
+                    request_id=str(entry_data.get("requestId", "")),
+                )
+            )
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Invalid entry data in block {block_idx}, entry {entry_idx}: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error processing entry: {e}")
+
+    return entries
+
+
 def _run_table_view(
-    args: argparse.Namespace, data_path: Path, view_mode: str, console: Console
+    args: argparse.Namespace, data_path: Path, view_mode: str, console: "Console"
 ) -> None:
     """Run table view mode (daily or monthly) with enhanced error handling.
 
@@ -383,23 +546,30 @@ def _run_table_view(
         view_mode: View mode ('daily' or 'monthly')
         console: Rich console instance
     """
-    logger = logging.getLogger(__name__)
+    from claude_monitor.data.aggregator import UsageAggregator
+    from claude_monitor.data.analysis import analyze_usage
+    from claude_monitor.terminal.themes import print_themed
+    from claude_monitor.ui.table_views import TableViewsController
+
+    print_error = functools.partial(print_themed, style="error")
+    print_warning = functools.partial(print_themed, style="warning")
+
     logger.info(f"Running {view_mode} view mode")
 
     # Validate inputs
     if view_mode not in ["daily", "monthly"]:
         logger.error(f"Invalid view mode: {view_mode}")
-        print_themed(f"Invalid view mode: {view_mode}. Must be 'daily' or 'monthly'", style="error")
+        print_error(f"Invalid view mode: {view_mode}. Must be 'daily' or 'monthly'")
         return
 
     if not data_path.exists():
         logger.error(f"Data path does not exist: {data_path}")
-        print_themed(f"Data path does not exist: {data_path}", style="error")
+        print_error(f"Data path does not exist: {data_path}")
         return
 
     if not data_path.is_dir():
         logger.error(f"Data path is not a directory: {data_path}")
-        print_themed(f"Data path is not a directory: {data_path}", style="error")
+        print_error(f"Data path is not a directory: {data_path}")
         return
 
     try:
@@ -413,89 +583,43 @@ def _run_table_view(
             )
         except FileNotFoundError as e:
             logger.error(f"Data file not found: {e}")
-            print_themed("No Claude usage data files found. Please use Claude Code to generate some data.", style="warning")
+            print_warning("No Claude usage data files found. Please use Claude Code to generate some data.")
             return
         except PermissionError as e:
             logger.error(f"Permission denied accessing data: {e}")
-            print_themed("Permission denied accessing usage data. Check file permissions.", style="error")
+            print_error("Permission denied accessing usage data. Check file permissions.")
             return
         except Exception as e:
             logger.error(f"Failed to analyze usage data: {e}", exc_info=True)
-            print_themed(f"Failed to analyze usage data: {e}", style="error")
+            print_error(f"Failed to analyze usage data: {e}")
             return
 
         if not usage_data:
             logger.info("No usage data returned from analysis")
-            print_themed(f"No usage data found for {view_mode} view", style="warning")
+            print_warning(f"No usage data found for {view_mode} view")
             return
 
         if "blocks" not in usage_data:
             logger.warning("Usage data missing 'blocks' key")
-            print_themed("Usage data format is invalid (missing blocks)", style="error")
+            print_error("Usage data format is invalid (missing blocks)")
             return
 
         # Create aggregator
         aggregator = UsageAggregator()
 
-        # Extract entries from blocks with error handling
-        from claude_monitor.core.models import UsageEntry
-        from claude_monitor.utils.time_utils import TimezoneHandler
-
-        entries = []
         blocks = usage_data.get("blocks", [])
 
         if not blocks:
             logger.info("No blocks found in usage data")
-            print_themed("No usage blocks found in the data", style="warning")
+            print_warning("No usage blocks found in the data")
             return
 
-        # Initialize timezone handler once
-        tz_handler = TimezoneHandler()
-
-        for block_idx, block in enumerate(blocks):
-            try:
-                # Skip gap blocks
-                if block.get("isGap", False):
-                    continue
-
-                block_entries = block.get("entries", [])
-                for entry_idx, entry_data in enumerate(block_entries):
-                    try:
-                        # Parse timestamp with error handling
-                        timestamp_str = entry_data.get("timestamp", "")
-                        if not timestamp_str:
-                            logger.warning(f"Missing timestamp in block {block_idx}, entry {entry_idx}")
-                            continue
-
-                        timestamp = tz_handler.parse_timestamp(timestamp_str)
-
-                        # Create entry with validation
-                        entry = UsageEntry(
-                            timestamp=timestamp,
-                            input_tokens=max(0, int(entry_data.get("inputTokens", 0))),
-                            output_tokens=max(0, int(entry_data.get("outputTokens", 0))),
-                            cache_creation_tokens=max(0, int(entry_data.get("cacheCreationTokens", 0))),
-                            cache_read_tokens=max(0, int(entry_data.get("cacheReadTokens", 0))),
-                            cost_usd=max(0.0, float(entry_data.get("costUSD", 0.0))),
-                            model=str(entry_data.get("model", "")),
-                            message_id=str(entry_data.get("messageId", "")),
-                            request_id=str(entry_data.get("requestId", "")),
-                        )
-                        entries.append(entry)
-                    except (ValueError, TypeError) as e:
-                        logger.warning(f"Invalid entry data in block {block_idx}, entry {entry_idx}: {e}")
-                        continue
-                    except Exception as e:
-                        logger.error(f"Unexpected error processing entry: {e}")
-                        continue
-
-            except Exception as e:
-                logger.error(f"Error processing block {block_idx}: {e}")
-                continue
+        # Extract entries from blocks with error handling
+        entries = _extract_usage_entries(blocks)
 
         if not entries:
             logger.info("No valid entries extracted from blocks")
-            print_themed("No valid usage entries found in the data", style="warning")
+            print_warning("No valid usage entries found in the data")
             return
 
         # Log entry count for debugging
@@ -509,11 +633,11 @@ def _run_table_view(
                 aggregated_data = aggregator.aggregate_monthly(entries)
         except Exception as e:
             logger.error(f"Failed to aggregate data: {e}", exc_info=True)
-            print_themed(f"Failed to aggregate {view_mode} data: {e}", style="error")
+            print_error(f"Failed to aggregate {view_mode} data: {e}")
             return
 
         if not aggregated_data:
-            print_themed(f"No {view_mode} data to display after aggregation", style="warning")
+            print_warning(f"No {view_mode} data to display after aggregation")
             return
 
         # Calculate totals
@@ -521,16 +645,14 @@ def _run_table_view(
             totals = aggregator.calculate_totals(aggregated_data)
         except Exception as e:
             logger.error(f"Failed to calculate totals: {e}", exc_info=True)
-            print_themed(f"Failed to calculate totals: {e}", style="error")
+            print_error(f"Failed to calculate totals: {e}")
             return
 
         # Create table view controller
         table_controller = TableViewsController()
 
         # Get timezone with validation
-        timezone = getattr(args, "timezone", "UTC")
-        if not timezone:
-            timezone = "UTC"
+        timezone = args.timezone or "UTC"
 
         # Create and display table with error handling
         try:
@@ -557,15 +679,13 @@ def _run_table_view(
 
             # Keep the display active
             try:
-                import time
-                while True:
-                    time.sleep(1)
+                _wait_for_interrupt()
             except KeyboardInterrupt:
                 logger.info("User interrupted table view")
 
         except Exception as e:
             logger.error(f"Failed to render {view_mode} view: {e}", exc_info=True)
-            print_themed(f"Failed to render {view_mode} view: {e}", style="error")
+            print_error(f"Failed to render {view_mode} view: {e}")
             return
 
     except KeyboardInterrupt:
@@ -574,6 +694,6 @@ def _run_table_view(
     except Exception as e:
         # Catch-all for unexpected errors
         logger.error(f"Unexpected error in {view_mode} view: {e}", exc_info=True)
-        print_themed(f"Unexpected error displaying {view_mode} data: {e}", style="error")
+        print_error(f"Unexpected error displaying {view_mode} data: {e}")
 if __name__ == "__main__":
     sys.exit(main())
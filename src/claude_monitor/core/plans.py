@@ -188,6 +188,10 @@ def get_token_limit(plan: str, blocks: Optional[List[Dict[str, Any]]] = None) ->
     Returns:
         Token limit for the plan
     """
+    # Standard plans have a fixed limit; skip the PlanConfig lookup
+    limit = TOKEN_LIMITS.get(plan)
+    if limit is not None:
+        return limit
     return Plans.get_token_limit(plan, blocks)
 
 
@@ -21,6 +21,17 @@ from claude_monitor.core.pricing import PricingCalculator
 from claude_monitor.error_handling import report_file_error
 from claude_monitor.utils.time_utils import TimezoneHandler
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# keep catching the stdlib exception regardless of the backend in use.
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
 FIELD_COST_USD = "cost_usd"
 FIELD_MODEL = "model"
 TOKEN_INPUT = "input_tokens"
@@ -105,7 +116,7 @@ def load_all_raw_entries(data_path: Optional[str] = None) -> List[Dict[str, Any]
                     if not line:
                         continue
                     try:
-                        all_raw_entries.append(json.loads(line))
+                        all_raw_entries.append(_json_loads(line))
                     except json.JSONDecodeError:
                         continue
         except Exception as e:
@@ -147,7 +158,7 @@ def _process_single_file(
                     continue
 
                 try:
-                    data = json.loads(line)
+                    data = _json_loads(line)
                     entries_read += 1
 
                     if not _should_process_entry(
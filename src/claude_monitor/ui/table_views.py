@@ -5,7 +5,7 @@ in table format using Rich library.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from rich.align import Align
 from rich.console import Console
@@ -17,9 +17,53 @@ from rich.text import Text
 from claude_monitor.utils.formatting import format_currency, format_number
 
 logger = logging.getLogger(__name__)
+
+# Token count keys of aggregated records, in column order
+_TOKEN_KEYS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_creation_tokens",
+    "cache_read_tokens",
+)
+
+
 class TableViewsController:
     """Controller for table-based views (daily, monthly)."""
 
+    __slots__ = (
+        "key_style",
+        "value_style",
+        "accent_style",
+        "success_style",
+        "warning_style",
+        "header_style",
+        "table_header_style",
+        "border_style",
+    )
+
+    # view type -> (label column header, data key, title period, label width)
+    _AGGREGATE_LAYOUTS: Dict[str, Tuple[str, str, str, int]] = {
+        "daily": ("Date", "date", "Daily", 12),
+        "monthly": ("Month", "month", "Monthly", 10),
+    }
+
+    # view type -> name of the method building its table
+    _BUILDERS: Dict[str, str] = {
+        "daily": "create_daily_table",
+        "monthly": "create_monthly_table",
+    }
+
+    # Columns after the period label: (header, style attribute, justify, width)
+    _STAT_COLUMNS: Tuple[Tuple[str, str, str, int], ...] = (
+        ("Models", "value_style", "left", 20),
+        ("Input", "value_style", "right", 12),
+        ("Output", "value_style", "right", 12),
+        ("Cache Create", "value_style", "right", 12),
+        ("Cache Read", "value_style", "right", 12),
+        ("Total Tokens", "accent_style", "right", 12),
+        ("Cost (USD)", "success_style", "right", 10),
+    )
+
     def __init__(self):
         """Initialize the table views controller."""
         # Define simple styles
@@ -45,65 +89,10 @@ class TableViewsController:
         Returns:
             Rich Table object
         """
-        # Create table with title
-        table = Table(
-            title=f"Claude Code Token Usage Report - Daily ({timezone})",
-            title_style="bold cyan",
-            show_header=True,
-            header_style="bold",
-            border_style="bright_blue",
-            expand=True,
-            show_lines=True,
+        return self._build_aggregate_table(
+            daily_data, totals, timezone, *self._AGGREGATE_LAYOUTS["daily"]
         )
 
-        # Add columns
-        table.add_column("Date", style=self.key_style, width=12)
-        table.add_column("Models", style=self.value_style, width=20)
-        table.add_column("Input", style=self.value_style, justify="right", width=12)
-        table.add_column("Output", style=self.value_style, justify="right", width=12)
-        table.add_column("Cache Create", style=self.value_style, justify="right", width=12)
-        table.add_column("Cache Read", style=self.value_style, justify="right", width=12)
-        table.add_column("Total Tokens", style=self.accent_style, justify="right", width=12)
-        table.add_column("Cost (USD)", style=self.success_style, justify="right", width=10)
-
-        # Add data rows
-        for data in daily_data:
-            models_text = self._format_models(data["models_used"])
-            total_tokens = (
-                data["input_tokens"]
-                + data["output_tokens"]
-                + data["cache_creation_tokens"]
-                + data["cache_read_tokens"]
-            )
-
-            table.add_row(
-                data["date"],
-                models_text,
-                format_number(data["input_tokens"]),
-                format_number(data["output_tokens"]),
-                format_number(data["cache_creation_tokens"]),
-                format_number(data["cache_read_tokens"]),
-                format_number(total_tokens),
-                format_currency(data["total_cost"]),
-            )
-
-        # Add separator
-        table.add_row("", "", "", "", "", "", "", "")
-
-        # Add totals row
-        table.add_row(
-            Text("Total", style=self.accent_style),
-            "",
-            Text(format_number(totals["input_tokens"]), style=self.accent_style),
-            Text(format_number(totals["output_tokens"]), style=self.accent_style),
-            Text(format_number(totals["cache_creation_tokens"]), style=self.accent_style),
-            Text(format_number(totals["cache_read_tokens"]), style=self.accent_style),
-            Text(format_number(totals["total_tokens"]), style=self.accent_style),
-            Text(format_currency(totals["total_cost"]), style=self.success_style),
-        )
-
-        return table
-
     def create_monthly_table(
         self, monthly_data: List[Dict[str, Any]], totals: Dict[str, Any], timezone: str = "UTC"
     ) -> Table:
@@ -114,12 +103,40 @@ class TableViewsController:
             totals: Total statistics
             timezone: Timezone for display
 
+        Returns:
+            Rich Table object
+        """
+        return self._build_aggregate_table(
+            monthly_data, totals, timezone, *self._AGGREGATE_LAYOUTS["monthly"]
+        )
+
+    def _build_aggregate_table(
+        self,
+        data_list: List[Dict[str, Any]],
+        totals: Dict[str, Any],
+        timezone: str,
+        label_column: str,
+        label_key: str,
+        title_period: str,
+        label_width: int,
+    ) -> Table:
+        """Create a statistics table for daily or monthly aggregated data.
+
+        Args:
+            data_list: List of aggregated data
+            totals: Total statistics
+            timezone: Timezone for display
+            label_column: Header of the period column ('Date' or 'Month')
+            label_key: Key of the period label ('date' or 'month')
+            title_period: Period name shown in the title ('Daily' or 'Monthly')
+            label_width: Width of the period column
+
         Returns:
             Rich Table object
         """
         # Create table with title
         table = Table(
-            title=f"Claude Code Token Usage Report - Monthly ({timezone})",
+            title=f"Claude Code Token Usage Report - {title_period} ({timezone})",
             title_style="bold cyan",
             show_header=True,
             header_style="bold",
@@ -129,53 +146,65 @@ class TableViewsController:
         )
 
         # Add columns
-        table.add_column("Month", style=self.key_style, width=10)
-        table.add_column("Models", style=self.value_style, width=20)
-        table.add_column("Input", style=self.value_style, justify="right", width=12)
-        table.add_column("Output", style=self.value_style, justify="right", width=12)
-        table.add_column("Cache Create", style=self.value_style, justify="right", width=12)
-        table.add_column("Cache Read", style=self.value_style, justify="right", width=12)
-        table.add_column("Total Tokens", style=self.accent_style, justify="right", width=12)
-        table.add_column("Cost (USD)", style=self.success_style, justify="right", width=10)
-
-        # Add data rows
-        for data in monthly_data:
-            models_text = self._format_models(data["models_used"])
-            total_tokens = (
-                data["input_tokens"]
-                + data["output_tokens"]
-                + data["cache_creation_tokens"]
-                + data["cache_read_tokens"]
-            )
+        add_column = table.add_column
+        add_column(label_column, style=self.key_style, width=label_width)
+        for header, style_attr, justify, width in self._STAT_COLUMNS:
+            add_column(header, style=getattr(self, style_attr), justify=justify, width=width)
 
-            table.add_row(
-                data["month"],
-                models_text,
-                format_number(data["input_tokens"]),
-                format_number(data["output_tokens"]),
-                format_number(data["cache_creation_tokens"]),
-                format_number(data["cache_read_tokens"]),
-                format_number(total_tokens),
-                format_currency(data["total_cost"]),
-            )
+        # Add data rows, formatted up front in one pass
+        add_row = table.add_row
+        for row in self._build_rows(data_list, label_key):
+            add_row(*row)
 
         # Add separator
         table.add_row("", "", "", "", "", "", "", "")
 
-        # Add totals row
+        # Add totals row; markup is only needed where the column style differs
+        accent = self.accent_style
         table.add_row(
-            Text("Total", style=self.accent_style),
+            f"[{accent}]Total[/]",
             "",
-            Text(format_number(totals["input_tokens"]), style=self.accent_style),
-            Text(format_number(totals["output_tokens"]), style=self.accent_style),
-            Text(format_number(totals["cache_creation_tokens"]), style=self.accent_style),
-            Text(format_number(totals["cache_read_tokens"]), style=self.accent_style),
-            Text(format_number(totals["total_tokens"]), style=self.accent_style),
-            Text(format_currency(totals["total_cost"]), style=self.success_style),
+            *[f"[{accent}]{format_number(totals[key])}[/]" for key in _TOKEN_KEYS],
+            format_number(totals["total_tokens"]),
+            format_currency(totals["total_cost"]),
         )
 
         return table
 
+    def _build_rows(
+        self, data_list: List[Dict[str, Any]], label_key: str
+    ) -> List[Tuple[str, ...]]:
+        """Format the cells of one row per aggregated period.
+
+        Args:
+            data_list: List of daily or monthly aggregated data
+            label_key: Key of the period label ('date' or 'month')
+
+        Returns:
+            List of row tuples, one string per column
+        """
+        format_models = self._format_models
+        fmt = format_number
+        rows: List[Tuple[str, ...]] = []
+        append = rows.append
+
+        for data in data_list:
+            inp, outp, cc, cr = [data[key] for key in _TOKEN_KEYS]
+            append(
+                (
+                    data[label_key],
+                    format_models(data["models_used"]),
+                    fmt(inp),
+                    fmt(outp),
+                    fmt(cc),
+                    fmt(cr),
+                    fmt(inp + outp + cc + cr),
+                    format_currency(data["total_cost"]),
+                )
+            )
+
+        return rows
+
     def create_summary_panel(self, view_type: str, totals: Dict[str, Any], period: str) -> Panel:
         """Create a summary panel for the table view.
 
@@ -210,7 +239,7 @@ class TableViewsController:
 
         return panel
 
-    def _format_models(self, models: List[str]) -> str:
+    def _format_models(self, models: Sequence[str]) -> str:
         """Format model names for display.
 
         Args:
@@ -221,12 +250,9 @@ class TableViewsController:
         """
         if not models:
             return "No models"
-
-        # Create bullet list
         if len(models) == 1:
             return models[0]
-        else:
-            return "\n".join([f"• {model}" for model in models])
+        return "\n".join("• " + model for model in models)
 
     def create_no_data_display(self, view_type: str) -> Panel:
         """Create a display for when no data is available.
@@ -275,10 +301,8 @@ class TableViewsController:
         Raises:
             ValueError: If view_type is not 'daily' or 'monthly'
         """
-        if view_type == "daily":
-            return self.create_daily_table(aggregate_data, totals, timezone)
-        elif view_type == "monthly":
-            return self.create_monthly_table(aggregate_data, totals, timezone)
-        else:
+        builder = self._BUILDERS.get(view_type)
+        if builder is None:
             raise ValueError(f"Invalid view type: {view_type}")
+        return getattr(self, builder)(aggregate_data, totals, timezone)
 
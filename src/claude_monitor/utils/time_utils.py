@@ -125,6 +125,10 @@ except ImportError:
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+_ISO_TZ_PATTERN: "re.Pattern[str]" = re.compile(
+    r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(\.\d+)?(Z|[+-]\d{2}:\d{2})?"
+)
+
 
 class TimeFormatDetector:
     """Unified time format detection using multiple strategies."""
@@ -365,10 +369,7 @@ class TimezoneHandler:
         if not timestamp_str:
             return None
 
-        iso_tz_pattern: str = (
-            r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(\.\d+)?(Z|[+-]\d{2}:\d{2})?"
-        )
-        match: Optional[re.Match[str]] = re.match(iso_tz_pattern, timestamp_str)
+        match: Optional[re.Match[str]] = _ISO_TZ_PATTERN.match(timestamp_str)
         if match:
             try:
                 base_str: str = match.group(1)
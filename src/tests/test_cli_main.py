@@ -1,8 +1,14 @@
 """Simplified tests for CLI main module."""
 
+import os
+import signal
+import sys
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+
 from claude_monitor.cli.main import main
 
 
@@ -78,7 +84,10 @@ class TestMain:
                 patch("claude_monitor.terminal.themes.get_themed_console"),
                 patch("claude_monitor.ui.display_controller.DisplayController"),
                 patch("claude_monitor.monitoring.orchestrator.MonitoringOrchestrator"),
-                patch("time.sleep", side_effect=KeyboardInterrupt),
+                patch(
+                    "claude_monitor.cli.main._wait_for_interrupt",
+                    side_effect=KeyboardInterrupt,
+                ),
                 patch("sys.exit"),
             ):  # Don't actually exit
                 result = main(["--plan", "pro"])
@@ -120,3 +129,89 @@ class TestFunctions:
             paths = discover_claude_data_paths(custom_paths)
             assert len(paths) == 1
             assert paths[0].name == "path"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX signals only")
+    def test_wait_for_interrupt_unblocks_on_sigint(self) -> None:
+        """Test waiting returns via KeyboardInterrupt on SIGINT and restores handler."""
+        from claude_monitor.cli.main import _wait_for_interrupt
+
+        previous_handler = signal.getsignal(signal.SIGINT)
+        timer = threading.Timer(0.1, os.kill, (os.getpid(), signal.SIGINT))
+        timer.start()
+        try:
+            with pytest.raises(KeyboardInterrupt):
+                _wait_for_interrupt()
+        finally:
+            timer.cancel()
+        assert signal.getsignal(signal.SIGINT) is previous_handler
+
+    def test_extract_usage_entries(self) -> None:
+        """Test entry extraction skips gaps and invalid entries and clamps negatives."""
+        from claude_monitor.cli.main import _extract_usage_entries
+
+        blocks = [
+            {
+                "isGap": False,
+                "entries": [
+                    {
+                        "timestamp": "2024-01-01T10:00:00+00:00",
+                        "inputTokens": 100,
+                        "outputTokens": -5,
+                        "costUSD": 0.5,
+                        "model": "claude-3-haiku",
+                    },
+                    {"timestamp": "", "inputTokens": 10},
+                    {"timestamp": "2024-01-01T11:00:00+00:00", "inputTokens": "bad"},
+                ],
+            },
+            {
+                "isGap": True,
+                "entries": [{"timestamp": "2024-01-01T12:00:00+00:00"}],
+            },
+        ]
+
+        entries = _extract_usage_entries(blocks)
+
+        assert len(entries) == 1
+        assert entries[0].input_tokens == 100
+        assert entries[0].output_tokens == 0
+        assert entries[0].cost_usd == 0.5
+        assert entries[0].timestamp.year == 2024
+
+    def test_extract_usage_entries_skips_malformed_blocks(self) -> None:
+        """Test malformed blocks and entries are skipped without losing valid ones."""
+        from claude_monitor.cli.main import _extract_usage_entries
+
+        good = {"timestamp": "2024-01-01T10:00:00+00:00", "inputTokens": 100}
+        blocks = [
+            None,
+            {"entries": None},
+            {"entries": ["junk", good]},
+        ]
+
+        entries = _extract_usage_entries(blocks)
+
+        assert len(entries) == 1
+        assert entries[0].input_tokens == 100
+
+    def test_parse_timestamps(self) -> None:
+        """Test batch timestamp parsing handles ISO, 'Z', naive and invalid values."""
+        from claude_monitor.cli.main import _parse_timestamps
+        from claude_monitor.utils.time_utils import TimezoneHandler
+
+        parsed = _parse_timestamps(
+            [
+                "2024-01-01T10:00:00+00:00",
+                "2024-01-01T10:00:00.123Z",
+                "2024-01-01 10:00:00",
+                "not a timestamp",
+                "",
+            ],
+            TimezoneHandler(),
+        )
+
+        assert parsed[0] is not None and parsed[0].hour == 10
+        assert parsed[1] is not None and parsed[1].utcoffset().total_seconds() == 0
+        assert parsed[2] is not None and parsed[2].tzinfo is not None
+        assert parsed[3] is None
+        assert parsed[4] is None
@@ -230,6 +230,13 @@ class TestLoadAllRawEntries:
             path_str = str(call_args[0])
             assert ".claude/projects" in path_str
 
+    def test_json_backend_raises_stdlib_decode_error(self) -> None:
+        from claude_monitor.data.reader import _json_loads
+
+        assert _json_loads('{"a": 1, "b": [1.5, "x"]}') == {"a": 1, "b": [1.5, "x"]}
+        with pytest.raises(json.JSONDecodeError):
+            _json_loads("invalid json")
+
 
 class TestFindJsonlFiles:
     """Test the _find_jsonl_files function."""
@@ -256,6 +256,22 @@ class TestTableViewsController:
         result = controller._format_models([])
         assert result == "No models"
 
+    def test_build_rows(self, controller: TableViewsController, sample_daily_data: List[Dict[str, Any]]) -> None:
+        """Test row tuples are fully formatted in column order."""
+        rows = controller._build_rows(sample_daily_data, "date")
+
+        assert len(rows) == 2
+        assert rows[1] == (
+            "2024-01-02",
+            "claude-3-opus",
+            "2,000",
+            "1,000",
+            "200",
+            "100",
+            "3,300",
+            "$0.10",
+        )
+
     def test_create_no_data_display(self, controller: TableViewsController) -> None:
         """Test creation of no data display."""
         panel = controller.create_no_data_display("daily")
@@ -286,6 +302,14 @@ class TestTableViewsController:
         with pytest.raises(ValueError, match="Invalid view type"):
             controller.create_aggregate_table(sample_daily_data, sample_totals, "weekly", "UTC")
 
+    def test_create_aggregate_table_dispatches_to_builder(self, sample_monthly_data: List[Dict[str, Any]], sample_totals: Dict[str, Any]) -> None:
+        """Test create_aggregate_table goes through the public per-view builder."""
+        with patch.object(TableViewsController, "create_monthly_table") as mock_build:
+            result = TableViewsController().create_aggregate_table(sample_monthly_data, sample_totals, "monthly", "UTC")
+
+        mock_build.assert_called_once_with(sample_monthly_data, sample_totals, "UTC")
+        assert result is mock_build.return_value
+
     def test_daily_table_timezone_display(self, controller: TableViewsController, sample_daily_data: List[Dict[str, Any]], sample_totals: Dict[str, Any]) -> None:
         """Test daily table displays correct timezone."""
         table = controller.create_daily_table(sample_daily_data, sample_totals, "America/New_York")
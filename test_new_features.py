@@ -6,24 +6,43 @@ import subprocess
 import sys
 
 
+def _enable_vt_mode():
+    """Enable ANSI escape sequences on the console (needed on Windows only)."""
+    if os.name != 'nt':
+        return True
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
+
+
+_VT_ENABLED = _enable_vt_mode()
+
+
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('clear' if os.name != 'nt' else 'cls')
+    if not _VT_ENABLED:
+        os.system('cls')
+        return
+    # Erase display and move the cursor home without spawning a shell
+    sys.stdout.write('\x1b[2J\x1b[H')
+    sys.stdout.flush()
 
 
 def run_command(cmd):
     """Run a command and handle interruption."""
     try:
-        # Change to src directory
-        original_dir = os.getcwd()
-        src_dir = os.path.join(os.path.dirname(__file__), 'src')
-        os.chdir(src_dir)
-        
-        # Run the command
-        subprocess.run(cmd, shell=True)
-        
-        # Change back
-        os.chdir(original_dir)
+        # Run from the src directory without changing our own cwd
+        src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+        subprocess.run(cmd, cwd=src_dir)
     except KeyboardInterrupt:
         print("\n\nReturning to menu...")
     except Exception as e:
@@ -32,6 +51,25 @@ def run_command(cmd):
     input("\nPress Enter to continue...")
 
 
+MONITOR = [sys.executable, '-m', 'claude_monitor']
+
+# Menu choice -> (message, command)
+MENU_COMMANDS = {
+    '1': ("Showing daily statistics... (Press Ctrl+C to stop)",
+          MONITOR + ['--view', 'daily']),
+    '2': ("Showing monthly statistics... (Press Ctrl+C to stop)",
+          MONITOR + ['--view', 'monthly']),
+    '3': ("Showing realtime monitoring... (Press Ctrl+C to stop)",
+          MONITOR),
+    '4': ("Showing daily statistics with dark theme... (Press Ctrl+C to stop)",
+          MONITOR + ['--view', 'daily', '--theme', 'dark']),
+    '5': ("Showing monthly statistics with light theme... (Press Ctrl+C to stop)",
+          MONITOR + ['--view', 'monthly', '--theme', 'light']),
+    '6': ("Showing help...",
+          MONITOR + ['--help']),
+}
+
+
 def main_menu():
     """Display main menu and handle user choice."""
     while True:
@@ -52,29 +90,10 @@ def main_menu():
         
         choice = input("\nEnter your choice (1-7): ").strip()
         
-        if choice == '1':
-            print("\nShowing daily statistics... (Press Ctrl+C to stop)")
-            run_command("python3 -m claude_monitor --view daily")
-        
-        elif choice == '2':
-            print("\nShowing monthly statistics... (Press Ctrl+C to stop)")
-            run_command("python3 -m claude_monitor --view monthly")
-        
-        elif choice == '3':
-            print("\nShowing realtime monitoring... (Press Ctrl+C to stop)")
-            run_command("python3 -m claude_monitor")
-        
-        elif choice == '4':
-            print("\nShowing daily statistics with dark theme... (Press Ctrl+C to stop)")
-            run_command("python3 -m claude_monitor --view daily --theme dark")
-        
-        elif choice == '5':
-            print("\nShowing monthly statistics with light theme... (Press Ctrl+C to stop)")
-            run_command("python3 -m claude_monitor --view monthly --theme light")
-        
-        elif choice == '6':
-            print("\nShowing help...")
-            run_command("python3 -m claude_monitor --help")
+        if choice in MENU_COMMANDS:
+            message, cmd = MENU_COMMANDS[choice]
+            print(f"\n{message}")
+            run_command(cmd)
         
         elif choice == '7':
             print("\nExiting...")